@@ -4,15 +4,20 @@ This module contains the application factory function for creating
 and configuring the Flask application instance.
 """
 
-from flask import Flask
-from flask_cors import CORS
-from typing import Optional, Tuple, Dict, Any
+import orjson
+from flask import Flask, Response
+from typing import Optional, Tuple
 
 from app.routes.articles import articles_bp
-from app.config.constants import ALLOWED_ORIGINS, TESTING_ENV
-from app.config.database import get_database_url, get_test_database_url, init_db, close_db, dispose_db
+from app.config.constants import TESTING_ENV
+from app.config.database import get_database_url, get_test_database_url, init_db, close_db
+from app.utils.cors import apply_cors_headers
+from app.utils.json_provider import OrjsonProvider
 from app.utils.response_helpers import create_not_found_response, create_internal_error_response
 
+# Health check payload never changes, so encode it once
+_HEALTH_RESPONSE_BODY = orjson.dumps({'status': 'healthy', 'service': 'llm-topix-backend'})
+
 
 def create_app(config_name: Optional[str] = None) -> Flask:
     """Create and configure the Flask application.
@@ -24,6 +29,7 @@ def create_app(config_name: Optional[str] = None) -> Flask:
         Flask: Configured Flask application instance
     """
     app = Flask(__name__)
+    app.json = OrjsonProvider(app)
     
     # Load configuration
     if config_name == TESTING_ENV:
@@ -39,30 +45,24 @@ def create_app(config_name: Optional[str] = None) -> Flask:
     app.teardown_appcontext(close_db)
     
     # Enable CORS for frontend integration
-    CORS(app, resources={
-        r"/api/*": {
-            "origins": ALLOWED_ORIGINS,
-            "methods": ["GET", "POST", "PUT", "DELETE"],
-            "allow_headers": ["Content-Type", "Authorization"]
-        }
-    })
+    app.after_request(apply_cors_headers)
     
     # Register blueprints
     app.register_blueprint(articles_bp)
     
     # Global error handlers
     @app.errorhandler(404)
-    def not_found(error: Exception) -> Tuple[Dict[str, str], int]:
+    def not_found(error: Exception) -> Tuple[Response, int]:
         return create_not_found_response()
     
     @app.errorhandler(500)
-    def internal_error(error: Exception) -> Tuple[Dict[str, str], int]:
+    def internal_error(error: Exception) -> Tuple[Response, int]:
         return create_internal_error_response()
     
     # Health check endpoint
     @app.route('/health')
-    def health_check() -> Tuple[Dict[str, str], int]:
-        return {'status': 'healthy', 'service': 'llm-topix-backend'}, 200
+    def health_check() -> Response:
+        return Response(_HEALTH_RESPONSE_BODY, status=200, mimetype='application/json')
     
     return app
 
@@ -13,6 +13,17 @@ DATABASE_PORT: Final[str] = os.getenv('DB_PORT', '5432')
 DATABASE_USER: Final[str] = os.getenv('DB_USER', 'postgres')
 DATABASE_PASS: Final[str] = os.getenv('DB_PASS', 'password')
 
+# Connection URL prefix, built once since the credentials above never change at runtime
+DATABASE_URL_PREFIX: Final[str] = (
+    f'postgresql://{DATABASE_USER}:{DATABASE_PASS}@{DATABASE_HOST}:{DATABASE_PORT}/'
+)
+
+# Connection pool sizing (overridable per deployment)
+SQLALCHEMY_POOL_SIZE: Final[int] = int(os.getenv('SQLALCHEMY_POOL_SIZE', '30'))
+SQLALCHEMY_MAX_OVERFLOW: Final[int] = int(os.getenv('SQLALCHEMY_MAX_OVERFLOW', '20'))
+SQLALCHEMY_POOL_TIMEOUT: Final[int] = int(os.getenv('SQLALCHEMY_POOL_TIMEOUT', '30'))
+SQLALCHEMY_POOL_RECYCLE: Final[int] = int(os.getenv('SQLALCHEMY_POOL_RECYCLE', '3600'))
+
 # Environment-specific database names
 DATABASE_NAME_DEV: Final[str] = os.getenv('DB_NAME_DEV', 'llm_topix_dev')
 DATABASE_NAME_TEST: Final[str] = os.getenv('DB_NAME_TEST', 'llm_topix_test')
@@ -21,6 +32,15 @@ DATABASE_NAME_TEST: Final[str] = os.getenv('DB_NAME_TEST', 'llm_topix_test')
 PERFORMANCE_THRESHOLD_MS: Final[int] = 50
 SUMMARY_MAX_LENGTH: Final[int] = 100
 SUMMARY_TRUNCATE_SUFFIX: Final[str] = "..."
+LATEST_ARTICLES_LIMIT: Final[int] = 5
+
+# Seconds a fetched latest-articles list is reused before querying again (0 disables)
+LATEST_ARTICLES_CACHE_TTL_SECONDS: Final[float] = float(
+    os.getenv('LATEST_ARTICLES_CACHE_TTL_SECONDS', '10')
+)
+
+# gzip level for precompressed API responses (favor speed; bodies are small)
+RESPONSE_GZIP_LEVEL: Final[int] = 5
 
 # Database field constraints
 ARTICLE_TITLE_MAX_LENGTH: Final[int] = 255
@@ -31,6 +51,12 @@ ALLOWED_ORIGINS: Final[list[str]] = [
     "http://localhost:3000",
     "http://127.0.0.1:3000"
 ]
+# How long browsers may cache preflight (OPTIONS) responses, in seconds
+CORS_MAX_AGE_SECONDS: Final[int] = 86400
+# CORS headers are only applied below this path prefix
+CORS_PATH_PREFIX: Final[str] = '/api/'
+CORS_ALLOWED_METHODS: Final[tuple[str, ...]] = ('GET', 'POST', 'PUT', 'DELETE')
+CORS_ALLOWED_HEADERS: Final[tuple[str, ...]] = ('Content-Type', 'Authorization')
 
 # Environment configurations
 TESTING_ENV: Final[str] = 'testing'
@@ -58,4 +84,4 @@ def build_database_url(database_name: str) -> str:
     Returns:
         A PostgreSQL connection URL string
     """
-    return f'postgresql://{DATABASE_USER}:{DATABASE_PASS}@{DATABASE_HOST}:{DATABASE_PORT}/{database_name}'
\ No newline at end of file
+    return DATABASE_URL_PREFIX + database_name
\ No newline at end of file
@@ -4,16 +4,20 @@ This module provides database configuration settings and utilities
 for connecting to PostgreSQL database with proper Flask session management.
 """
 
+import functools
 import logging
 import os
 from typing import Any
-from flask import g, current_app
 from sqlalchemy import create_engine
-from sqlalchemy.orm import sessionmaker, Session
+from sqlalchemy.orm import scoped_session, sessionmaker, Session
 from .constants import (
     build_database_url,
     DATABASE_NAME_DEV,
-    DATABASE_NAME_TEST
+    DATABASE_NAME_TEST,
+    SQLALCHEMY_MAX_OVERFLOW,
+    SQLALCHEMY_POOL_RECYCLE,
+    SQLALCHEMY_POOL_SIZE,
+    SQLALCHEMY_POOL_TIMEOUT
 )
 
 logger = logging.getLogger(__name__)
@@ -23,32 +27,41 @@ _engine = None
 _SessionLocal = None
 
 
-def get_database_url() -> str:
-    """Get database URL from environment variables.
+@functools.lru_cache(maxsize=2)
+def _resolve_db_url(env_var: str, default_db_name: str) -> str:
+    """Resolve a database URL from the environment, once per process.
     
+    Args:
+        env_var: Environment variable that may hold a full connection URL
+        default_db_name: Database name used to build the URL when unset
+        
     Returns:
         str: Database connection URL
     """
-    database_url = os.getenv('DATABASE_URL')
+    database_url = os.getenv(env_var)
     if not database_url:
-        database_url = build_database_url(DATABASE_NAME_DEV)
-        logger.info(f"Using default database configuration: {database_url}")
+        database_url = build_database_url(default_db_name)
+        logger.info("Using default database configuration: %s", database_url)
     
     return database_url
 
 
+def get_database_url() -> str:
+    """Get database URL from environment variables.
+    
+    Returns:
+        str: Database connection URL
+    """
+    return _resolve_db_url('DATABASE_URL', DATABASE_NAME_DEV)
+
+
 def get_test_database_url() -> str:
     """Get test database URL.
     
     Returns:
         str: Test database connection URL
     """
-    test_database_url = os.getenv('TEST_DATABASE_URL')
-    if not test_database_url:
-        test_database_url = build_database_url(DATABASE_NAME_TEST)
-        logger.info(f"Using default test database configuration: {test_database_url}")
-    
-    return test_database_url
+    return _resolve_db_url('TEST_DATABASE_URL', DATABASE_NAME_TEST)
 
 
 def init_db(app: Any) -> None:
@@ -68,48 +81,49 @@ def init_db(app: Any) -> None:
         _engine = create_engine(
             database_url,
             pool_pre_ping=True,  # Verify connections before use
-            pool_recycle=3600,   # Recycle connections after 1 hour
+            pool_size=SQLALCHEMY_POOL_SIZE,
+            max_overflow=SQLALCHEMY_MAX_OVERFLOW,
+            pool_timeout=SQLALCHEMY_POOL_TIMEOUT,
+            pool_recycle=SQLALCHEMY_POOL_RECYCLE,
             echo=app.config.get('SQLALCHEMY_ECHO', False)
         )
         logger.info("Database engine initialized")
     
     if _SessionLocal is None:
-        _SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=_engine)
-        logger.info("Database session factory initialized")
+        _SessionLocal = scoped_session(
+            sessionmaker(autocommit=False, autoflush=False, bind=_engine)
+        )
+        logger.info("Database session registry initialized")
 
 
 def get_db() -> Session:
     """Get database session for the current request.
     
-    This function provides a database session that is scoped to the current
-    Flask request context. The same session is reused within a single request.
+    This function provides a database session from a thread-local registry.
+    The same session is reused within a single request and released by
+    close_db() when the request context ends.
     
     Returns:
         Session: SQLAlchemy database session
     """
-    if 'db' not in g:
-        if _SessionLocal is None:
-            raise RuntimeError("Database not initialized. Call init_db() first.")
-        g.db = _SessionLocal()
-        logger.debug("Created new database session for request")
+    if _SessionLocal is None:
+        raise RuntimeError("Database not initialized. Call init_db() first.")
     
-    return g.db
+    return _SessionLocal()
 
 
 def close_db(e: Any = None) -> None:
     """Close database session at the end of request.
     
     This function is registered as a teardown handler and automatically
-    closes the database session when the request context ends.
+    closes and discards the current thread's session when the request
+    context ends.
     
     Args:
         e: Exception that caused teardown (if any)
     """
-    db = g.pop('db', None)
-    
-    if db is not None:
-        db.close()
-        logger.debug("Closed database session for request")
+    if _SessionLocal is not None:
+        _SessionLocal.remove()
 
 
 def get_engine() -> Any:
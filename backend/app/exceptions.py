@@ -4,6 +4,8 @@
 class ApplicationError(Exception):
     """Base exception class for all application errors."""
     
+    __slots__ = ('message', 'status_code')
+    
     def __init__(self, message: str, status_code: int = 500) -> None:
         super().__init__(message)
         self.message = message
@@ -13,6 +15,8 @@ class ApplicationError(Exception):
 class DatabaseError(ApplicationError):
     """Exception raised for database-related errors."""
     
+    __slots__ = ()
+    
     def __init__(self, message: str = "Database operation failed") -> None:
         super().__init__(message, status_code=503)
 
@@ -20,6 +24,8 @@ class DatabaseError(ApplicationError):
 class ValidationError(ApplicationError):
     """Exception raised for data validation errors."""
     
+    __slots__ = ()
+    
     def __init__(self, message: str = "Invalid input data") -> None:
         super().__init__(message, status_code=400)
 
@@ -27,5 +33,7 @@ class ValidationError(ApplicationError):
 class NotFoundError(ApplicationError):
     """Exception raised when requested resource is not found."""
     
+    __slots__ = ()
+    
     def __init__(self, message: str = "Resource not found") -> None:
         super().__init__(message, status_code=404)
\ No newline at end of file
@@ -3,7 +3,7 @@
 from datetime import datetime
 from typing import Optional
 
-from sqlalchemy import Column, DateTime, Integer, String, Text
+from sqlalchemy import Column, DateTime, FetchedValue, Index, Integer, String, Text, desc, func
 from sqlalchemy.ext.declarative import declarative_base
 
 from app.config.constants import ARTICLE_TITLE_MAX_LENGTH, ARTICLE_URL_MAX_LENGTH
@@ -29,16 +29,23 @@ class Article(Base):
     id: Optional[int] = Column(Integer, primary_key=True, autoincrement=True)
     title: str = Column(String(ARTICLE_TITLE_MAX_LENGTH), nullable=False)
     summary: str = Column(Text, nullable=False)
-    published_at: datetime = Column(DateTime, nullable=False, index=True)
+    published_at: datetime = Column(DateTime, nullable=False)
     source_url: str = Column(String(ARTICLE_URL_MAX_LENGTH), nullable=False, unique=True)
-    created_at: datetime = Column(DateTime, default=lambda: datetime.utcnow(), nullable=False)
+    created_at: datetime = Column(DateTime, server_default=func.now(), nullable=False)
+    # Refreshed by the update_articles_updated_at trigger (database/init.sql)
     updated_at: datetime = Column(
         DateTime, 
-        default=lambda: datetime.utcnow(), 
-        onupdate=lambda: datetime.utcnow(), 
+        server_default=func.now(), 
+        server_onupdate=FetchedValue(), 
         nullable=False
     )
     
+    __table_args__ = (
+        # Matches the latest-articles ORDER BY published_at DESC LIMIT n query;
+        # named by string because published_at is annotated as a datetime
+        Index('idx_articles_published_at', desc('published_at')),
+    )
+    
     def __repr__(self) -> str:
         """String representation of Article."""
         return f'<Article {self.id}: {self.title[:50]}>'
\ No newline at end of file
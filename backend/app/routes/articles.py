@@ -4,55 +4,112 @@ This module contains Flask routes for article operations,
 including the endpoint for retrieving latest articles.
 """
 
-from flask import Blueprint, current_app
-from typing import Dict, Any, Tuple
+import gzip
+import hashlib
+from flask import Blueprint, Response, current_app, request
+from typing import Dict, Any, List, NamedTuple, Optional, Tuple, Union
 
+from app.config.database import get_db
 from app.services.article_service import ArticleService
 from app.exceptions import DatabaseError, ApplicationError
-from app.utils import (
-    create_error_response,
-    create_success_response,
-    format_datetime_to_utc_iso8601
-)
+from app.utils import create_error_response, create_success_response
 from app.config.constants import (
     ERROR_CODE_DATABASE_UNAVAILABLE,
     ERROR_CODE_INTERNAL_SERVER_ERROR,
     ERROR_CODE_RESOURCE_NOT_FOUND,
-    ERROR_CODE_METHOD_NOT_ALLOWED
+    ERROR_CODE_METHOD_NOT_ALLOWED,
+    RESPONSE_GZIP_LEVEL
 )
 
 
 articles_bp = Blueprint('articles', __name__, url_prefix='/api/articles')
 
 
-def _format_articles_for_response(articles: list[Dict[str, Any]]) -> list[Dict[str, Any]]:
-    """Format articles for JSON response.
+class _RenderedArticles(NamedTuple):
+    """Encoded response bodies for one latest-articles list."""
+    
+    articles: List[Dict[str, Any]]
+    body: bytes
+    gzip_body: Optional[bytes]
+    etag: str
+
+
+# Rendering of the list last returned by ArticleService. The service hands out
+# the same list object until its cache expires, so an identity check is enough
+# to know the rendered bodies are still current.
+_rendered_latest_articles: Optional[_RenderedArticles] = None
+
+
+def _render_latest_articles(articles: List[Dict[str, Any]]) -> _RenderedArticles:
+    """Return the encoded body and ETag for a latest-articles list.
+    
+    The JSON body is encoded once per list, so repeated requests within
+    the service cache TTL only copy bytes. The gzip body is left unset
+    until a client accepts it; see _gzip_latest_articles().
     
     Args:
-        articles: List of article dictionaries from service
+        articles: Formatted articles as returned by ArticleService
         
     Returns:
-        List of formatted article dictionaries with UTC ISO8601 datetime strings
+        _RenderedArticles: Plain body, ETag and the gzip body if already built
     """
-    formatted_articles = []
-    for article in articles:
-        formatted_article = article.copy()
-        if 'published_at' in formatted_article and formatted_article['published_at']:
-            formatted_article['published_at'] = format_datetime_to_utc_iso8601(formatted_article['published_at'])
-        formatted_articles.append(formatted_article)
+    global _rendered_latest_articles
+    
+    rendered = _rendered_latest_articles
+    if rendered is None or rendered.articles is not articles:
+        response, _ = create_success_response({
+            'articles': articles,
+            'count': len(articles)
+        })
+        body = response.get_data()
+        rendered = _RenderedArticles(
+            articles=articles,
+            body=body,
+            gzip_body=None,
+            etag=hashlib.blake2b(body, digest_size=16).hexdigest()
+        )
+        _rendered_latest_articles = rendered
     
-    return formatted_articles
+    return rendered
+
+
+def _gzip_latest_articles(rendered: _RenderedArticles) -> bytes:
+    """Return the gzip-compressed body, compressing it on first use.
+    
+    The result is stored on the cached rendering, so a list is compressed
+    at most once and never for clients that do not accept gzip.
+    
+    Args:
+        rendered: Rendering returned by _render_latest_articles()
+        
+    Returns:
+        bytes: The gzip-compressed JSON body
+    """
+    global _rendered_latest_articles
+    
+    gzip_body = rendered.gzip_body
+    if gzip_body is None:
+        gzip_body = gzip.compress(rendered.body, compresslevel=RESPONSE_GZIP_LEVEL, mtime=0)
+        if _rendered_latest_articles is rendered:
+            _rendered_latest_articles = rendered._replace(gzip_body=gzip_body)
+    
+    return gzip_body
 
 
 @articles_bp.route('/latest', methods=['GET'])
-def get_latest_articles() -> Tuple[Dict[str, Any], int]:
+def get_latest_articles() -> Union[Response, Tuple[Response, int]]:
     """Get the latest articles endpoint.
     
     This endpoint retrieves the most recently published articles
     and returns them in JSON format for frontend consumption.
     
+    Successful responses carry an ETag; requests whose If-None-Match
+    matches it receive an empty 304 response. Clients accepting gzip
+    receive a compressed body, built once per articles list.
+    
     Returns:
-        Tuple[Dict[str, Any], int]: JSON response and HTTP status code
+        Union[Response, Tuple[Response, int]]: JSON response, with an
+            HTTP status code for error responses
         
     Response Format:
         {
@@ -72,17 +129,24 @@ def get_latest_articles() -> Tuple[Dict[str, Any], int]:
         500: Internal server error
     """
     try:
-        from app.config.database import get_db
         db_session = get_db()
         article_service = ArticleService(db_session)
         articles = article_service.get_latest_articles()
         
-        formatted_articles = _format_articles_for_response(articles)
-        
-        return create_success_response({
-            'articles': formatted_articles,
-            'count': len(formatted_articles)
-        })
+        # Naive published_at datetimes are serialized as UTC ISO8601 by OrjsonProvider
+        rendered = _render_latest_articles(articles)
+        if request.accept_encodings.quality('gzip') > 0:
+            response = Response(_gzip_latest_articles(rendered), mimetype='application/json')
+            response.content_encoding = 'gzip'
+            # Each encoding is a distinct representation with its own ETag
+            response.set_etag(rendered.etag + '-gzip')
+        else:
+            response = Response(rendered.body, mimetype='application/json')
+            response.set_etag(rendered.etag)
+        response.vary.add('Accept-Encoding')
+        # make_conditional() updates the response in place (304 on a match)
+        response.make_conditional(request)
+        return response
         
     except DatabaseError as e:
         current_app.logger.error(f"Database error in get_latest_articles: {e.message}")
@@ -110,7 +174,7 @@ def get_latest_articles() -> Tuple[Dict[str, Any], int]:
 
 
 @articles_bp.errorhandler(404)
-def not_found_error(error: Exception) -> Tuple[Dict[str, str], int]:
+def not_found_error(error: Exception) -> Tuple[Response, int]:
     """Handle 404 errors for articles blueprint."""
     return create_error_response(
         ERROR_CODE_RESOURCE_NOT_FOUND,
@@ -120,7 +184,7 @@ def not_found_error(error: Exception) -> Tuple[Dict[str, str], int]:
 
 
 @articles_bp.errorhandler(405)
-def method_not_allowed_error(error: Exception) -> Tuple[Dict[str, str], int]:
+def method_not_allowed_error(error: Exception) -> Tuple[Response, int]:
     """Handle 405 errors for articles blueprint."""
     return create_error_response(
         ERROR_CODE_METHOD_NOT_ALLOWED,
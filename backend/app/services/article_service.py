@@ -5,20 +5,44 @@ article-related business operations including retrieval and formatting.
 """
 
 import logging
-from typing import List, Dict, Any, Optional
+import threading
+from typing import List, Dict, Any, Optional, Tuple
 import time
 
-from sqlalchemy import desc, select
+from sqlalchemy import desc, func, select
 from sqlalchemy.orm import Session
 from sqlalchemy.exc import SQLAlchemyError
 
+from app.config.database import get_db
 from app.models.article import Article
 from app.exceptions import DatabaseError, ApplicationError
-from app.config.constants import PERFORMANCE_THRESHOLD_MS
-from app.services.formatters import ArticleFormatter
+from app.config.constants import (
+    LATEST_ARTICLES_CACHE_TTL_SECONDS,
+    LATEST_ARTICLES_LIMIT,
+    PERFORMANCE_THRESHOLD_MS,
+    SUMMARY_MAX_LENGTH
+)
+from app.services.formatters import format_articles_list
 
 logger = logging.getLogger(__name__)
 
+# Only SUMMARY_MAX_LENGTH + 1 characters are needed to decide on truncation,
+# so avoid transferring full summary bodies from the database
+_SUMMARY_HEAD = func.substr(Article.summary, 1, SUMMARY_MAX_LENGTH + 1).label('summary')
+
+# Built once so every call reuses the same construct and its compiled-SQL cache entry
+_LATEST_ARTICLES_STMT = (
+    select(Article.id, Article.title, _SUMMARY_HEAD, Article.published_at, Article.source_url)
+    .order_by(desc(Article.published_at))
+    .limit(LATEST_ARTICLES_LIMIT)
+)
+
+# Process-wide (expires_at, articles) entry shared by all service instances.
+# Replaced as a whole tuple so readers never see a half-updated entry; the
+# lock only makes concurrent misses wait for a single refill.
+_latest_articles_cache: Optional[Tuple[float, List[Dict[str, Any]]]] = None
+_latest_articles_cache_lock = threading.Lock()
+
 
 class ArticleService:
     """Service class for article-related business operations.
@@ -43,6 +67,9 @@ class ArticleService:
         limits the result to 5 items, and formats them for frontend consumption.
         The summary field is truncated based on constants.
         
+        Results are cached process-wide for LATEST_ARTICLES_CACHE_TTL_SECONDS,
+        so the returned list is shared between callers and must not be mutated.
+        
         Returns:
             List[Dict[str, Any]]: List of formatted article dictionaries
         
@@ -50,11 +77,26 @@ class ArticleService:
             DatabaseError: When database operations fail
             ApplicationError: When unexpected errors occur
         """
-        start_time = time.time()
+        global _latest_articles_cache
+        
+        start_time = time.monotonic()
+        cached = _latest_articles_cache
+        if cached is not None and start_time < cached[0]:
+            return cached[1]
         
         try:
-            articles = self._fetch_articles_from_database()
-            formatted_articles = ArticleFormatter.format_articles_list(articles)
+            with _latest_articles_cache_lock:
+                # Another thread may have refilled the cache while we waited
+                cached = _latest_articles_cache
+                if cached is not None and time.monotonic() < cached[0]:
+                    return cached[1]
+                
+                articles = self._fetch_articles_from_database()
+                formatted_articles = format_articles_list(articles)
+                _latest_articles_cache = (
+                    time.monotonic() + LATEST_ARTICLES_CACHE_TTL_SECONDS,
+                    formatted_articles
+                )
             self._check_performance(start_time)
             
             return formatted_articles
@@ -64,6 +106,16 @@ class ArticleService:
         except Exception as e:
             raise ApplicationError(f"Unexpected error in get_latest_articles: {str(e)}")
     
+    @staticmethod
+    def invalidate_cache() -> None:
+        """Discard the cached latest articles.
+        
+        Call after new articles are ingested so the next request
+        reads them from the database instead of waiting for the TTL.
+        """
+        global _latest_articles_cache
+        _latest_articles_cache = None
+    
     def _get_session(self) -> Session:
         """Get database session for operations.
         
@@ -75,7 +127,6 @@ class ArticleService:
         
         # Fall back to Flask request context if no session injected
         try:
-            from app.config.database import get_db
             return get_db()
         except Exception as e:
             raise DatabaseError(f"Unable to get database session: {str(e)}")
@@ -84,26 +135,20 @@ class ArticleService:
         """Fetch articles from database with proper query optimization.
         
         Returns:
-            List of article database objects
+            List of article row mappings keyed by column name
         """
-        session = self._get_session()
-        
-        stmt = (
-            select(Article.id, Article.title, Article.summary, Article.published_at, Article.source_url)
-            .order_by(desc(Article.published_at))
-            .limit(5)
-        )
-        
-        result = session.execute(stmt)
-        return result.fetchall()
+        return self._get_session().execute(_LATEST_ARTICLES_STMT).mappings().all()
     
     def _check_performance(self, start_time: float) -> None:
         """Check if operation completed within performance threshold.
         
         Args:
-            start_time: Operation start time from time.time()
+            start_time: Operation start time from time.monotonic()
         """
-        execution_time_ms = (time.time() - start_time) * 1000
+        if not logger.isEnabledFor(logging.WARNING):
+            return
+        
+        execution_time_ms = (time.monotonic() - start_time) * 1000
         if execution_time_ms > PERFORMANCE_THRESHOLD_MS:
             logger.warning(
                 f"get_latest_articles took {execution_time_ms:.2f}ms, "
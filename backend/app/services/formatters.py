@@ -4,7 +4,7 @@ This module contains formatters for converting database objects
 to API response formats, promoting reusability and separation of concerns.
 """
 
-from typing import Dict, Any, Union
+from typing import Dict, Any, List, Mapping, Union
 import logging
 
 from app.config.constants import SUMMARY_MAX_LENGTH, SUMMARY_TRUNCATE_SUFFIX
@@ -12,71 +12,116 @@ from app.config.constants import SUMMARY_MAX_LENGTH, SUMMARY_TRUNCATE_SUFFIX
 logger = logging.getLogger(__name__)
 
 
-class ArticleFormatter:
-    """Formatter class for article data transformations."""
+def truncate_summary(summary: Union[str, None], max_length: int = SUMMARY_MAX_LENGTH) -> str:
+    """Truncate summary text to specified length with ellipsis.
     
-    @staticmethod
-    def truncate_summary(summary: Union[str, None], max_length: int = SUMMARY_MAX_LENGTH) -> str:
-        """Truncate summary text to specified length with ellipsis.
+    Args:
+        summary: The original summary text (can be None)
+        max_length: Maximum allowed length (default from constants)
         
-        Args:
-            summary: The original summary text (can be None)
-            max_length: Maximum allowed length (default from constants)
-            
-        Returns:
-            Truncated summary with ellipsis if needed, empty string if None
-        """
-        if summary is None:
-            return ""
+    Returns:
+        Truncated summary with ellipsis if needed, empty string if None
+    """
+    if summary is None:
+        return ""
+    
+    if len(summary) <= max_length:
+        return summary
+    
+    return summary[:max_length] + SUMMARY_TRUNCATE_SUFFIX
+
+
+def format_article_for_api(article: Mapping[str, Any]) -> Dict[str, Any]:
+    """Format a database article row for API response.
+    
+    Args:
+        article: Database article row mapping (RowMapping or dict)
         
-        if len(summary) <= max_length:
-            return summary
+    Returns:
+        Dictionary formatted for API response
         
-        return summary[:max_length] + SUMMARY_TRUNCATE_SUFFIX
+    Raises:
+        ValueError: When required fields are None or missing
+    """
+    article_id = article.get('id')
+    title = article.get('title')
+    published_at = article.get('published_at')
+    source_url = article.get('source_url')
     
-    @staticmethod
-    def format_article_for_api(article: Any) -> Dict[str, Any]:
-        """Format a database article object for API response.
-        
-        Args:
-            article: Database article object/row
-            
-        Returns:
-            Dictionary formatted for API response
-            
-        Raises:
-            ValueError: When required fields are None or missing
-        """
-        # Validate required fields are not None
-        if article.id is None:
+    # Validate required fields with one combined check; only a failing
+    # row pays for working out which field to report
+    if article_id is None or title is None or published_at is None or source_url is None:
+        if article_id is None:
             raise ValueError("Article ID cannot be None for API formatting")
-        if article.title is None:
+        if title is None:
             raise ValueError("Article title cannot be None for API formatting")
-        if article.published_at is None:
+        if published_at is None:
             raise ValueError("Article published_at cannot be None for API formatting")
-        if article.source_url is None:
-            raise ValueError("Article source_url cannot be None for API formatting")
+        raise ValueError("Article source_url cannot be None for API formatting")
+    
+    return {
+        'id': article_id,
+        'title': title,
+        'summary_truncated': truncate_summary(article.get('summary')),
+        'published_at': published_at,
+        'source_url': source_url
+    }
+
+
+def format_articles_list(articles: list) -> list[Dict[str, Any]]:
+    """Format a list of articles for API response.
+    
+    Equivalent to calling format_article_for_api() per row, but builds
+    the dictionaries inline with the truncation settings bound to locals.
+    
+    Args:
+        articles: List of database article row mappings
+        
+    Returns:
+        List of formatted article dictionaries
         
-        try:
-            return {
-                'id': article.id,
-                'title': article.title,
-                'summary_truncated': ArticleFormatter.truncate_summary(getattr(article, 'summary', None)),
-                'published_at': article.published_at,
-                'source_url': article.source_url
-            }
-        except AttributeError as e:
-            logger.error(f"Error formatting article: missing attribute {e}")
-            raise ValueError(f"Invalid article object: {e}")
+    Raises:
+        ValueError: When required fields are None
+    """
+    max_length = SUMMARY_MAX_LENGTH
+    suffix = SUMMARY_TRUNCATE_SUFFIX
+    formatted: List[Dict[str, Any]] = []
+    append = formatted.append
     
-    @staticmethod
-    def format_articles_list(articles: list) -> list[Dict[str, Any]]:
-        """Format a list of articles for API response.
+    for article in articles:
+        article_id = article['id']
+        title = article['title']
+        summary = article['summary']
+        published_at = article['published_at']
+        source_url = article['source_url']
+        
+        if article_id is None or title is None or published_at is None or source_url is None:
+            # Reuse the per-field validation for a precise error message
+            format_article_for_api(article)
         
-        Args:
-            articles: List of database article objects/rows
-            
-        Returns:
-            List of formatted article dictionaries
-        """
-        return [ArticleFormatter.format_article_for_api(article) for article in articles]
\ No newline at end of file
+        if summary is None:
+            summary = ""
+        elif len(summary) > max_length:
+            summary = summary[:max_length] + suffix
+        
+        append({
+            'id': article_id,
+            'title': title,
+            'summary_truncated': summary,
+            'published_at': published_at,
+            'source_url': source_url
+        })
+    
+    return formatted
+
+
+class ArticleFormatter:
+    """Formatter class for article data transformations.
+    
+    Kept for backward compatibility; new code should call the
+    module-level functions directly.
+    """
+    
+    truncate_summary = staticmethod(truncate_summary)
+    format_article_for_api = staticmethod(format_article_for_api)
+    format_articles_list = staticmethod(format_articles_list)
\ No newline at end of file
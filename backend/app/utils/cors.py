@@ -0,0 +1,55 @@
+"""Cross-origin resource sharing (CORS) support.
+
+This module adds CORS headers to API responses for the allowed frontend
+origins. It is registered as an after_request handler in create_app().
+"""
+
+from typing import Final
+
+from flask import Response, request
+
+from app.config.constants import (
+    ALLOWED_ORIGINS,
+    CORS_ALLOWED_HEADERS,
+    CORS_ALLOWED_METHODS,
+    CORS_MAX_AGE_SECONDS,
+    CORS_PATH_PREFIX
+)
+
+# Precomputed lookup sets and header values
+_ALLOWED_ORIGIN_SET: Final[frozenset[str]] = frozenset(ALLOWED_ORIGINS)
+_ALLOWED_METHOD_SET: Final[frozenset[str]] = frozenset(CORS_ALLOWED_METHODS)
+_ALLOW_METHODS_VALUE: Final[str] = ', '.join(CORS_ALLOWED_METHODS)
+_ALLOW_HEADERS_VALUE: Final[str] = ', '.join(CORS_ALLOWED_HEADERS)
+_MAX_AGE_VALUE: Final[str] = str(CORS_MAX_AGE_SECONDS)
+
+
+def apply_cors_headers(response: Response) -> Response:
+    """Add CORS headers to API responses for allowed origins.
+    
+    Requests without an Origin header, from origins that are not allowed,
+    or outside CORS_PATH_PREFIX are returned untouched. Preflight requests
+    additionally receive the allowed methods, headers and max age.
+    
+    Args:
+        response: The response about to be sent
+        
+    Returns:
+        Response: The same response, with CORS headers when applicable
+    """
+    origin = request.headers.get('Origin')
+    if origin not in _ALLOWED_ORIGIN_SET or not request.path.startswith(CORS_PATH_PREFIX):
+        return response
+    
+    headers = response.headers
+    headers['Access-Control-Allow-Origin'] = origin
+    response.vary.add('Origin')
+    
+    if request.method == 'OPTIONS':
+        requested_method = request.headers.get('Access-Control-Request-Method', '').upper()
+        if requested_method in _ALLOWED_METHOD_SET:
+            headers['Access-Control-Allow-Methods'] = _ALLOW_METHODS_VALUE
+            headers['Access-Control-Allow-Headers'] = _ALLOW_HEADERS_VALUE
+            headers['Access-Control-Max-Age'] = _MAX_AGE_VALUE
+    
+    return response
@@ -32,16 +32,14 @@ def format_datetime_to_utc_iso8601(dt: datetime) -> str:
     if dt is None:
         return None
     
-    # Check if datetime is naive (no timezone info)
-    if dt.tzinfo is None or dt.tzinfo.utcoffset(dt) is None:
-        # Assume naive datetime is already in UTC and add UTC timezone
-        dt_utc = dt.replace(tzinfo=timezone.utc)
-    else:
-        # Convert timezone-aware datetime to UTC
-        dt_utc = dt.astimezone(timezone.utc)
+    # Check if datetime is timezone-aware
+    if dt.tzinfo is not None and dt.tzinfo.utcoffset(dt) is not None:
+        # Convert timezone-aware datetime to naive UTC
+        dt = dt.astimezone(timezone.utc).replace(tzinfo=None)
     
-    # Format as ISO8601 with 'Z' suffix for UTC
-    return dt_utc.isoformat().replace('+00:00', 'Z')
+    # Naive datetimes are already in UTC; append 'Z' instead of
+    # formatting an offset and replacing '+00:00' afterwards
+    return dt.isoformat() + 'Z'
 
 
 def ensure_utc_datetime(dt: Union[datetime, None]) -> Union[datetime, None]:
@@ -0,0 +1,80 @@
+"""JSON serialization provider for Flask.
+
+This module provides an orjson-backed replacement for Flask's default
+JSON provider, used by jsonify() and by views returning dictionaries.
+"""
+
+from typing import Any, Final, Type, Union, cast
+
+import orjson
+from flask import Response
+from flask.json.provider import JSONProvider
+
+# Naive datetimes are stored as UTC, so serialize them with a 'Z' suffix
+ORJSON_OPTIONS: Final[int] = orjson.OPT_NAIVE_UTC | orjson.OPT_UTC_Z
+
+
+class OrjsonProvider(JSONProvider):
+    """Flask JSON provider that serializes with orjson.
+    
+    Naive datetime objects (as loaded from TIMESTAMP columns) are encoded
+    natively as UTC ISO8601 strings, e.g. '2024-05-29T12:00:00Z'.
+    """
+    
+    def dumps(self, obj: Any, **kwargs: Any) -> str:
+        """Serialize data as a JSON string.
+        
+        Args:
+            obj: The data to serialize
+            **kwargs: Ignored; accepted for JSONProvider compatibility
+            
+        Returns:
+            JSON encoded string
+        """
+        return orjson.dumps(obj, option=ORJSON_OPTIONS).decode()
+    
+    def loads(self, s: Union[str, bytes], **kwargs: Any) -> Any:
+        """Deserialize data from a JSON string or bytes.
+        
+        Args:
+            s: The JSON text to parse
+            **kwargs: Ignored; accepted for JSONProvider compatibility
+            
+        Returns:
+            The decoded Python object
+        """
+        return orjson.loads(s)
+    
+    def response(self, *args: Any, **kwargs: Any) -> Response:
+        """Serialize the given arguments into an application/json response.
+        
+        Follows jsonify(): a single positional argument is serialized as
+        is, several are serialized as a list, and keyword arguments as an
+        object. The encoded bytes are passed straight to the response
+        class, skipping the bytes to str round-trip of dumps().
+        
+        Args:
+            *args: A single value, or several values to serialize as a list
+            **kwargs: Keys and values to serialize as an object
+            
+        Returns:
+            Response: JSON response object
+            
+        Raises:
+            TypeError: If both positional and keyword arguments are given
+        """
+        if args and kwargs:
+            raise TypeError("app.json.response() takes either args or kwargs, not both")
+        
+        obj: Any
+        if len(args) == 1:
+            obj = args[0]
+        else:
+            obj = args or kwargs or None
+        
+        # Flask types app.response_class as the sansio base class
+        response_class = cast(Type[Response], self._app.response_class)
+        return response_class(
+            orjson.dumps(obj, option=ORJSON_OPTIONS),
+            mimetype='application/json'
+        )
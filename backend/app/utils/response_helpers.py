@@ -4,11 +4,28 @@ This module provides utility functions for creating standardized
 API responses across the application.
 """
 
+from datetime import datetime, timezone
 from typing import Dict, Tuple, Any
-from flask import jsonify
 
+import orjson
+from flask import Response
 
-def create_error_response(error_code: str, message: str, status_code: int, details: Dict[str, Any] = None) -> Tuple[Dict[str, str], int]:
+from app.utils.json_provider import ORJSON_OPTIONS
+
+
+def _json_response(payload: Dict[str, Any]) -> Response:
+    """Serialize a payload straight into an application/json response.
+    
+    Args:
+        payload: The response body
+        
+    Returns:
+        Response: JSON response object
+    """
+    return Response(orjson.dumps(payload, option=ORJSON_OPTIONS), mimetype='application/json')
+
+
+def create_error_response(error_code: str, message: str, status_code: int, details: Dict[str, Any] = None) -> Tuple[Response, int]:
     """Create a standardized error response according to CLAUDE.md format.
     
     Args:
@@ -18,25 +35,26 @@ def create_error_response(error_code: str, message: str, status_code: int, detai
         details: Optional additional error details
         
     Returns:
-        Tuple containing JSON response dict and status code
+        Tuple containing JSON response and status code
     """
-    from datetime import datetime
+    if details is None:
+        details = {
+            "timestamp": datetime.now(timezone.utc).strftime('%Y-%m-%dT%H:%M:%SZ')
+        }
     
     error_response = {
         "status": "error",
         "error": {
             "code": error_code,
             "message": message,
-            "details": details or {
-                "timestamp": datetime.utcnow().isoformat() + "Z"
-            }
+            "details": details
         }
     }
     
-    return jsonify(error_response), status_code
+    return _json_response(error_response), status_code
 
 
-def create_success_response(data: Any, status_code: int = 200, message: str = None) -> Tuple[Dict[str, Any], int]:
+def create_success_response(data: Any, status_code: int = 200, message: str = None) -> Tuple[Response, int]:
     """Create a standardized success response according to CLAUDE.md format.
     
     Args:
@@ -45,7 +63,7 @@ def create_success_response(data: Any, status_code: int = 200, message: str = No
         message: Optional success message
         
     Returns:
-        Tuple containing JSON response dict and status code
+        Tuple containing JSON response and status code
     """
     response = {
         "status": "success",
@@ -55,17 +73,17 @@ def create_success_response(data: Any, status_code: int = 200, message: str = No
     if message:
         response["message"] = message
     
-    return jsonify(response), status_code
+    return _json_response(response), status_code
 
 
-def create_not_found_response(resource: str = "resource") -> Tuple[Dict[str, str], int]:
+def create_not_found_response(resource: str = "resource") -> Tuple[Response, int]:
     """Create a standardized 404 response.
     
     Args:
         resource: The type of resource that was not found
         
     Returns:
-        Tuple containing JSON response dict and 404 status code
+        Tuple containing JSON response and 404 status code
     """
     return create_error_response(
         'RESOURCE_NOT_FOUND',
@@ -74,11 +92,11 @@ def create_not_found_response(resource: str = "resource") -> Tuple[Dict[str, str
     )
 
 
-def create_internal_error_response() -> Tuple[Dict[str, str], int]:
+def create_internal_error_response() -> Tuple[Response, int]:
     """Create a standardized 500 response.
     
     Returns:
-        Tuple containing JSON response dict and 500 status code
+        Tuple containing JSON response and 500 status code
     """
     return create_error_response(
         'INTERNAL_SERVER_ERROR',
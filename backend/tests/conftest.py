@@ -0,0 +1,140 @@
+"""Shared pytest fixtures for the backend test suite.
+
+This module provides the Flask application and test client fixtures
+used across test modules, and registers the "db" marker for tests that
+run against the in-memory SQLite database.
+"""
+
+from __future__ import annotations
+
+import functools
+from typing import TYPE_CHECKING, Any, Iterator
+
+import pytest
+
+# Flask, SQLAlchemy and the application are imported inside the fixtures
+# that need them, so collecting modules that use none of these fixtures
+# (formatters, date helpers) does not load the whole stack
+if TYPE_CHECKING:
+    from flask import Flask
+    from flask.testing import FlaskClient
+    from sqlalchemy.engine import Engine
+    from sqlalchemy.orm import Session
+
+
+def pytest_configure(config: pytest.Config) -> None:
+    """Register the markers used by the backend test suite."""
+    config.addinivalue_line(
+        'markers', 'db: uses the in-memory SQLite database (deselect with -m "not db")'
+    )
+
+
+def pytest_collection_modifyitems(items: list[pytest.Item]) -> None:
+    """Mark every test that depends on the SQLite engine with 'db'.
+    
+    Tests must not reach the application's configured database through
+    get_db(); database-backed tests use db_session or db_client, so
+    -m "not db" runs no test that needs a database.
+    """
+    for item in items:
+        if 'sqlite_engine' in getattr(item, 'fixturenames', ()):
+            item.add_marker(pytest.mark.db)
+
+
+@functools.lru_cache(maxsize=4)
+def _cached_app(env: str) -> Flask:
+    """Build the Flask application once per environment name.
+    
+    Args:
+        env: Environment name passed to create_app()
+        
+    Returns:
+        Flask: The application instance shared by all tests for that env
+    """
+    from app.app import create_app
+    
+    return create_app(env)
+
+
+@pytest.fixture(scope="session")
+def app() -> Flask:
+    """Provide the testing application, built once for the whole session."""
+    from app.config.constants import TESTING_ENV
+    
+    return _cached_app(TESTING_ENV)
+
+
+@pytest.fixture
+def client(app: Flask) -> FlaskClient:
+    """Provide a fresh test client per test against the shared app.
+    
+    No application context is pushed here; the test client pushes one
+    for every request it dispatches.
+    """
+    return app.test_client()
+
+
+@pytest.fixture(scope="session")
+def sqlite_engine() -> Iterator[Engine]:
+    """Provide an in-memory SQLite engine with the schema created once.
+    
+    StaticPool keeps the single in-memory database alive across
+    connections, so the DDL runs only once per session.
+    """
+    from sqlalchemy import create_engine, event
+    from sqlalchemy.pool import StaticPool
+    
+    from app.models.article import Base
+    
+    engine = create_engine(
+        'sqlite://',
+        poolclass=StaticPool,
+        connect_args={'check_same_thread': False}
+    )
+    
+    # pysqlite manages transactions itself and breaks SAVEPOINT handling;
+    # disable that and emit BEGIN explicitly so nested transactions work
+    @event.listens_for(engine, 'connect')
+    def _disable_pysqlite_transactions(dbapi_connection: Any, connection_record: Any) -> None:
+        dbapi_connection.isolation_level = None
+    
+    @event.listens_for(engine, 'begin')
+    def _emit_begin(connection: Any) -> None:
+        connection.exec_driver_sql('BEGIN')
+    
+    Base.metadata.create_all(engine)
+    yield engine
+    engine.dispose()
+
+
+@pytest.fixture
+def db_session(sqlite_engine: Engine) -> Iterator[Session]:
+    """Provide a session whose changes are rolled back after the test.
+    
+    The session joins an outer transaction through a SAVEPOINT, so
+    commits made by the code under test are discarded in teardown.
+    Cached latest articles are dropped on both sides of the test so
+    rows from one test never leak into another.
+    """
+    from sqlalchemy.orm import Session
+    
+    from app.services.article_service import ArticleService
+    
+    connection = sqlite_engine.connect()
+    transaction = connection.begin()
+    session = Session(bind=connection, join_transaction_mode='create_savepoint')
+    ArticleService.invalidate_cache()
+    
+    yield session
+    
+    ArticleService.invalidate_cache()
+    session.close()
+    transaction.rollback()
+    connection.close()
+
+
+@pytest.fixture
+def db_client(client: FlaskClient, db_session: Session, monkeypatch: pytest.MonkeyPatch) -> FlaskClient:
+    """Provide a test client whose article routes use the SQLite test session."""
+    monkeypatch.setattr('app.routes.articles.get_db', lambda: db_session)
+    return client
\ No newline at end of file
@@ -5,198 +5,280 @@ specifically the /api/articles/latest endpoint.
 """
 
 import pytest
-import json
+import gzip
 from datetime import datetime
-from unittest.mock import patch, Mock
-from typing import Dict, Any
+from unittest.mock import Mock
+
+from flask import Flask, Response
+from flask.testing import FlaskClient
+from werkzeug.test import TestResponse
+from sqlalchemy.orm import Session
 
-from app.app import create_app
 from app.exceptions import DatabaseError, ApplicationError
-from app.config.constants import TESTING_ENV
+from app.models.article import Article
+from app.services.article_service import ArticleService
+from app.config.constants import CORS_MAX_AGE_SECONDS
+
+# Keys every article in a successful response must have, no more and no less
+_REQUIRED_ARTICLE_KEYS = frozenset(('id', 'title', 'summary_truncated', 'published_at', 'source_url'))
+
+# Articles served by the patched service behind latest_response
+_SERVICE_ARTICLES = [
+    {
+        'id': 1,
+        'title': 'Newest Article',
+        'summary_truncated': 'Newest summary',
+        'published_at': datetime(2024, 5, 29, 12, 0, 0),
+        'source_url': 'https://example.com/newest'
+    },
+    {
+        'id': 2,
+        'title': 'Older Article',
+        'summary_truncated': 'Older summary',
+        'published_at': datetime(2024, 5, 28, 12, 0, 0),
+        'source_url': 'https://example.com/older'
+    }
+]
+
+
+@pytest.fixture
+def mock_service(monkeypatch: pytest.MonkeyPatch) -> Mock:
+    """Replace ArticleService.get_latest_articles with a Mock for one test."""
+    mock = Mock()
+    monkeypatch.setattr(ArticleService, 'get_latest_articles', mock)
+    return mock
+
+
+def _call_latest_articles_view(app: Flask) -> Response:
+    """Invoke the latest-articles view directly, skipping routing and the WSGI test client."""
+    with app.test_request_context('/api/articles/latest'):
+        return app.make_response(app.view_functions['articles.get_latest_articles']())
+
+
+@pytest.fixture(scope="module")
+def latest_response(app: Flask) -> TestResponse:
+    """Fetch /api/articles/latest once from an allowed origin for read-only checks.
+    
+    The service is patched only for this one request, so the response does
+    not depend on a reachable database and later tests see the real service.
+    """
+    with pytest.MonkeyPatch.context() as monkeypatch:
+        monkeypatch.setattr(ArticleService, 'get_latest_articles', Mock(return_value=_SERVICE_ARTICLES))
+        return app.test_client().get(
+            '/api/articles/latest',
+            headers={'Origin': 'http://localhost:3000'}
+        )
 
 
 class TestArticleAPI:
     """Test cases for article-related API endpoints."""
     
-    def setup_method(self) -> None:
-        """Set up test fixtures before each test method."""
-        self.app = create_app(TESTING_ENV)
-        self.client = self.app.test_client()
-        self.app_context = self.app.app_context()
-        self.app_context.push()
-    
-    def teardown_method(self) -> None:
-        """Clean up after each test method."""
-        self.app_context.pop()
-    
-    def test_get_latest_articles_endpoint_exists(self) -> None:
+    def test_get_latest_articles_endpoint_exists(self, latest_response: TestResponse) -> None:
         """Test that the /api/articles/latest endpoint exists and responds.
         
         This test verifies that the endpoint is properly configured
         and returns a valid HTTP response.
         """
-        response = self.client.get('/api/articles/latest')
+        response = latest_response
         
-        # Should not return 404 (endpoint should exist)
-        assert response.status_code != 404
+        assert response.status_code == 200
     
-    def test_get_latest_articles_returns_json(self) -> None:
+    def test_get_latest_articles_returns_json(self, latest_response: TestResponse) -> None:
         """Test that the endpoint returns valid JSON response.
         
         This test ensures that the response is properly formatted
         as JSON with correct content type headers.
         """
-        response = self.client.get('/api/articles/latest')
+        response = latest_response
         
         assert response.content_type == 'application/json'
         
-        # Should be able to parse as JSON
-        data = json.loads(response.data)
-        assert isinstance(data, list)
+        # Should be able to parse as JSON; successful responses are wrapped
+        # in a {"status", "data"} object
+        data = response.get_json()
+        assert isinstance(data, dict)
+        assert data['status'] == 'success'
     
-    def test_get_latest_articles_endpoint(self) -> None:
+    def test_get_latest_articles_endpoint(self, latest_response: TestResponse) -> None:
         """Test the structure of successful API response according to CLAUDE.md format.
         
         This test verifies that the API returns articles in the CLAUDE.md compliant
         structured response format: {"status": "success", "data": {"articles": [...], "count": N}}
         and that each article contains all required fields including 'id'.
         """
-        response = self.client.get('/api/articles/latest')
+        response = latest_response
         
-        if response.status_code == 200:
-            data = json.loads(response.data)
-            
-            # Verify top-level response structure per CLAUDE.md
-            assert 'status' in data, f"Response missing 'status' field: {data.keys()}"
-            assert data['status'] == 'success', f"Expected status 'success', got: {data['status']}"
-            
-            assert 'data' in data, f"Response missing 'data' field: {data.keys()}"
-            assert isinstance(data['data'], dict), f"'data' should be an object, got: {type(data['data'])}"
-            
-            # Verify data object structure
-            data_obj = data['data']
-            assert 'articles' in data_obj, f"Data object missing 'articles' field: {data_obj.keys()}"
-            assert isinstance(data_obj['articles'], list), f"'articles' should be a list, got: {type(data_obj['articles'])}"
-            
-            assert 'count' in data_obj, f"Data object missing 'count' field: {data_obj.keys()}"
-            assert isinstance(data_obj['count'], int), f"'count' should be an integer, got: {type(data_obj['count'])}"
-            assert data_obj['count'] == len(data_obj['articles']), f"Count {data_obj['count']} doesn't match articles length {len(data_obj['articles'])}"
-            
-            # Verify each article has required fields including 'id'
-            for article in data_obj['articles']:
-                assert 'id' in article, f"Article missing 'id' field: {article.keys()}"
-                assert isinstance(article['id'], int), f"Article 'id' is not an integer: {type(article['id'])}"
-                assert article['id'] > 0, f"Article 'id' should be positive: {article['id']}"
-                
-                required_keys = {'id', 'title', 'summary_truncated', 'published_at', 'source_url'}
-                assert set(article.keys()) == required_keys, f"Article missing required fields. Expected: {required_keys}, Got: {set(article.keys())}"
-    
-    def test_get_latest_articles_handles_database_error(self) -> None:
-        """Test API error handling when database operations fail.
-        
-        This test verifies that database errors are properly handled
-        and return appropriate HTTP status codes.
-        """
-        with patch('app.services.article_service.ArticleService.get_latest_articles') as mock_service:
-            mock_service.side_effect = DatabaseError("Database connection failed")
-            
-            response = self.client.get('/api/articles/latest')
-            
-            assert response.status_code == 503
+        data = response.get_json()
+        
+        # Verify top-level response structure per CLAUDE.md
+        assert 'status' in data, f"Response missing 'status' field: {data.keys()}"
+        assert data['status'] == 'success', f"Expected status 'success', got: {data['status']}"
+        
+        assert 'data' in data, f"Response missing 'data' field: {data.keys()}"
+        assert isinstance(data['data'], dict), f"'data' should be an object, got: {type(data['data'])}"
+        
+        # Verify data object structure
+        data_obj = data['data']
+        assert 'articles' in data_obj, f"Data object missing 'articles' field: {data_obj.keys()}"
+        assert isinstance(data_obj['articles'], list), f"'articles' should be a list, got: {type(data_obj['articles'])}"
+        
+        assert 'count' in data_obj, f"Data object missing 'count' field: {data_obj.keys()}"
+        assert isinstance(data_obj['count'], int), f"'count' should be an integer, got: {type(data_obj['count'])}"
+        assert data_obj['count'] == len(data_obj['articles']), f"Count {data_obj['count']} doesn't match articles length {len(data_obj['articles'])}"
+        
+        assert data_obj['count'] == len(_SERVICE_ARTICLES)
+        
+        # Verify each article has required fields including 'id'
+        for article in data_obj['articles']:
+            assert 'id' in article, f"Article missing 'id' field: {article.keys()}"
+            assert isinstance(article['id'], int), f"Article 'id' is not an integer: {type(article['id'])}"
+            assert article['id'] > 0, f"Article 'id' should be positive: {article['id']}"
             
-            error_data = json.loads(response.data)
-            assert 'error' in error_data
+            assert article.keys() == _REQUIRED_ARTICLE_KEYS, f"Article missing required fields. Expected: {set(_REQUIRED_ARTICLE_KEYS)}, Got: {set(article.keys())}"
     
-    def test_get_latest_articles_handles_application_error(self) -> None:
-        """Test API error handling for general application errors.
+    @pytest.mark.parametrize('error, expected_status', [
+        (DatabaseError("Database connection failed"), 503),
+        (ApplicationError("Internal error", 500), 500),
+    ], ids=['database_error', 'application_error'])
+    def test_get_latest_articles_handles_service_errors(
+        self, app: Flask, mock_service: Mock, error: Exception, expected_status: int
+    ) -> None:
+        """Test API error handling when the service raises.
         
-        This test verifies that application errors are properly handled
-        and return appropriate error responses.
+        This test verifies that database errors map to 503, other
+        application errors to their status code, and that both return
+        an error response body.
         """
-        with patch('app.services.article_service.ArticleService.get_latest_articles') as mock_service:
-            mock_service.side_effect = ApplicationError("Internal error", 500)
-            
-            response = self.client.get('/api/articles/latest')
-            
-            assert response.status_code == 500
-            
-            error_data = json.loads(response.data)
-            assert 'error' in error_data
+        mock_service.side_effect = error
+        
+        response = _call_latest_articles_view(app)
+        
+        assert response.status_code == expected_status
+        
+        error_data = response.get_json()
+        assert 'error' in error_data
     
-    def test_get_latest_articles_cors_headers(self) -> None:
+    def test_get_latest_articles_cors_headers(self, latest_response: TestResponse) -> None:
         """Test that CORS headers are properly set for cross-origin requests.
         
         This test ensures that the frontend can properly access the API
         from different origins.
         """
-        response = self.client.get('/api/articles/latest')
+        response = latest_response
         
         # CORS headers should be present
-        assert 'Access-Control-Allow-Origin' in response.headers
+        assert response.headers.get('Access-Control-Allow-Origin') == 'http://localhost:3000'
+        assert 'Origin' in response.headers.get('Vary', '')
+    
+    def test_get_latest_articles_rejects_unknown_origin(self, client: FlaskClient, mock_service: Mock) -> None:
+        """Test that CORS headers are not sent to origins outside the allow list."""
+        mock_service.return_value = _SERVICE_ARTICLES
+        
+        response = client.get(
+            '/api/articles/latest',
+            headers={'Origin': 'http://evil.example.com'}
+        )
+        
+        assert 'Access-Control-Allow-Origin' not in response.headers
+    
+    def test_health_check_returns_healthy_status(self, client: FlaskClient) -> None:
+        """Test that the /health endpoint reports the service as healthy."""
+        response = client.get('/health')
+        
+        assert response.status_code == 200
+        assert response.content_type == 'application/json'
+        assert response.get_json() == {'status': 'healthy', 'service': 'llm-topix-backend'}
     
-    def test_get_latest_articles_limits_response_size(self) -> None:
+    def test_preflight_response_is_cacheable(self, client: FlaskClient) -> None:
+        """Test that CORS preflight responses advertise Access-Control-Max-Age.
+        
+        This test ensures browsers can cache the preflight result instead of
+        issuing an OPTIONS round-trip before every cross-origin request.
+        """
+        response = client.options(
+            '/api/articles/latest',
+            headers={
+                'Origin': 'http://localhost:3000',
+                'Access-Control-Request-Method': 'GET'
+            }
+        )
+        
+        assert response.headers.get('Access-Control-Max-Age') == str(CORS_MAX_AGE_SECONDS)
+    
+    def test_get_latest_articles_limits_response_size(self, db_client: FlaskClient, db_session: Session) -> None:
         """Test that API response is limited to maximum 5 articles.
         
         This test verifies that the API enforces the business rule
         of returning only the latest 5 articles.
         """
-        response = self.client.get('/api/articles/latest')
+        db_session.add_all([
+            Article(
+                title=f'Article {day}',
+                summary='Summary',
+                published_at=datetime(2024, 5, day, 12, 0, 0),
+                source_url=f'https://example.com/{day}'
+            )
+            for day in range(1, 8)
+        ])
+        db_session.commit()
+        
+        response = db_client.get('/api/articles/latest')
         
-        if response.status_code == 200:
-            data = json.loads(response.data)
-            assert len(data) <= 5
+        assert response.status_code == 200
+        data = response.get_json()['data']
+        assert data['count'] == 5
+        assert len(data['articles']) == 5
     
-    def test_api_returns_published_at_as_utc_iso8601(self) -> None:
+    def test_api_returns_published_at_as_utc_iso8601(self, client: FlaskClient, mock_service: Mock) -> None:
         """Test that published_at dates are always returned with UTC timezone info.
         
         This test verifies timezone handling by mocking ArticleService to return
         naive datetime objects and ensuring the API converts them to UTC ISO8601 format.
         RED phase test - should fail with current implementation.
         """
-        with patch('app.services.article_service.ArticleService.get_latest_articles') as mock_service:
-            # Mock service to return articles with naive datetime (no timezone)
-            naive_datetime = datetime(2024, 5, 29, 12, 0, 0)  # No timezone info
-            mock_articles = [
-                {
-                    'id': 1,
-                    'title': 'Test Article',
-                    'summary_truncated': 'Test summary...',
-                    'published_at': naive_datetime,  # Naive datetime
-                    'source_url': 'https://example.com/test'
-                }
-            ]
-            mock_service.return_value = mock_articles
-            
-            response = self.client.get('/api/articles/latest')
-            
-            assert response.status_code == 200
-            data = json.loads(response.data)
-            
-            # Verify response structure
-            assert data['status'] == 'success'
-            assert 'data' in data
-            assert 'articles' in data['data']
-            assert len(data['data']['articles']) == 1
-            
-            article = data['data']['articles'][0]
-            published_at = article['published_at']
-            
-            # The published_at should end with 'Z' (UTC) or '+00:00'
-            # This test should FAIL with current implementation since naive datetime
-            # will be converted to ISO format without timezone info
-            assert published_at.endswith('Z') or published_at.endswith('+00:00'), \
-                f"published_at should have UTC timezone info, got: {published_at}"
-            
-            # Should be parseable as UTC datetime
-            try:
-                # This should parse correctly with timezone info
-                parsed_dt = datetime.fromisoformat(published_at.replace('Z', '+00:00'))
-                assert parsed_dt.tzinfo is not None, \
-                    f"Parsed datetime should have timezone info: {parsed_dt}"
-            except ValueError as e:
-                pytest.fail(f"published_at is not valid ISO8601 format: {published_at}, error: {e}")
-    
-    def test_api_error_response_conforms_to_standard_format(self) -> None:
+        # Mock service to return articles with naive datetime (no timezone)
+        naive_datetime = datetime(2024, 5, 29, 12, 0, 0)  # No timezone info
+        mock_articles = [
+            {
+                'id': 1,
+                'title': 'Test Article',
+                'summary_truncated': 'Test summary...',
+                'published_at': naive_datetime,  # Naive datetime
+                'source_url': 'https://example.com/test'
+            }
+        ]
+        mock_service.return_value = mock_articles
+        
+        response = client.get('/api/articles/latest')
+        
+        assert response.status_code == 200
+        data = response.get_json()
+        
+        # Verify response structure
+        assert data['status'] == 'success'
+        assert 'data' in data
+        assert 'articles' in data['data']
+        assert len(data['data']['articles']) == 1
+        
+        article = data['data']['articles'][0]
+        published_at = article['published_at']
+        
+        # The published_at should end with 'Z' (UTC) or '+00:00'
+        # This test should FAIL with current implementation since naive datetime
+        # will be converted to ISO format without timezone info
+        assert published_at.endswith('Z') or published_at.endswith('+00:00'), \
+            f"published_at should have UTC timezone info, got: {published_at}"
+        
+        # Should be parseable as UTC datetime
+        try:
+            # This should parse correctly with timezone info
+            parsed_dt = datetime.fromisoformat(published_at.replace('Z', '+00:00'))
+            assert parsed_dt.tzinfo is not None, \
+                f"Parsed datetime should have timezone info: {parsed_dt}"
+        except ValueError as e:
+            pytest.fail(f"published_at is not valid ISO8601 format: {published_at}, error: {e}")
+    
+    def test_api_error_response_conforms_to_standard_format(self, client: FlaskClient, mock_service: Mock) -> None:
         """Test that API error responses conform to CLAUDE.md standard format.
         
         This test verifies error responses have the correct structure:
@@ -204,10 +286,10 @@ class TestArticleAPI:
         RED phase test - should verify current error handling is correct.
         """
         # Test 404 error format
-        response = self.client.get('/api/articles/nonexistent')
+        response = client.get('/api/articles/nonexistent')
         assert response.status_code == 404
         
-        error_data = json.loads(response.data)
+        error_data = response.get_json()
         
         # Verify top-level error response structure per CLAUDE.md
         assert 'status' in error_data, f"Error response missing 'status' field: {error_data.keys()}"
@@ -229,19 +311,94 @@ class TestArticleAPI:
         assert isinstance(error_obj['details'], dict), f"'details' should be an object, got: {type(error_obj['details'])}"
         
         # Test database error format with mock
-        with patch('app.services.article_service.ArticleService.get_latest_articles') as mock_service:
-            mock_service.side_effect = DatabaseError("Database connection failed")
-            
-            response = self.client.get('/api/articles/latest')
-            assert response.status_code == 503
-            
-            error_data = json.loads(response.data)
-            
-            # Verify same structure for database errors
-            assert error_data['status'] == 'error'
-            assert 'error' in error_data
-            error_obj = error_data['error']
-            assert error_obj['code'] == 'DATABASE_UNAVAILABLE'
-            assert 'message' in error_obj
-            assert 'details' in error_obj
-            assert isinstance(error_obj['details'], dict)
\ No newline at end of file
+        mock_service.side_effect = DatabaseError("Database connection failed")
+        
+        response = client.get('/api/articles/latest')
+        assert response.status_code == 503
+        
+        error_data = response.get_json()
+        
+        # Verify same structure for database errors
+        assert error_data['status'] == 'error'
+        assert 'error' in error_data
+        error_obj = error_data['error']
+        assert error_obj['code'] == 'DATABASE_UNAVAILABLE'
+        assert 'message' in error_obj
+        assert 'details' in error_obj
+        assert isinstance(error_obj['details'], dict)
+    
+    def test_get_latest_articles_supports_conditional_requests(self, client: FlaskClient, mock_service: Mock) -> None:
+        """Test that a matching If-None-Match yields an empty 304 response."""
+        mock_service.return_value = [
+            {
+                'id': 1,
+                'title': 'Test Article',
+                'summary_truncated': 'Test summary',
+                'published_at': datetime(2024, 5, 29, 12, 0, 0),
+                'source_url': 'https://example.com/test'
+            }
+        ]
+        
+        first = client.get('/api/articles/latest')
+        etag = first.headers.get('ETag')
+        assert first.status_code == 200
+        assert etag is not None
+        
+        second = client.get('/api/articles/latest', headers={'If-None-Match': etag})
+        assert second.status_code == 304
+        assert second.data == b''
+    
+    def test_get_latest_articles_serves_gzip_when_accepted(self, client: FlaskClient, mock_service: Mock) -> None:
+        """Test that gzip-accepting clients get a compressed copy of the same body."""
+        mock_service.return_value = [
+            {
+                'id': 1,
+                'title': 'Test Article',
+                'summary_truncated': 'Test summary',
+                'published_at': datetime(2024, 5, 29, 12, 0, 0),
+                'source_url': 'https://example.com/test'
+            }
+        ]
+        
+        plain = client.get('/api/articles/latest')
+        compressed = client.get('/api/articles/latest', headers={'Accept-Encoding': 'gzip'})
+        
+        assert compressed.status_code == 200
+        assert compressed.headers.get('Content-Encoding') == 'gzip'
+        assert 'Accept-Encoding' in compressed.headers.get('Vary', '')
+        assert gzip.decompress(compressed.data) == plain.data
+        assert compressed.headers.get('ETag') != plain.headers.get('ETag')
+    
+    def test_get_latest_articles_compresses_only_for_gzip_clients(
+        self, client: FlaskClient, mock_service: Mock, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Test that the gzip body is built lazily, once per articles list."""
+        mock_service.return_value = [dict(article) for article in _SERVICE_ARTICLES]
+        compress = Mock(wraps=gzip.compress)
+        monkeypatch.setattr('app.routes.articles.gzip.compress', compress)
+        
+        for _ in range(3):
+            client.get('/api/articles/latest')
+        assert compress.call_count == 0
+        
+        for _ in range(2):
+            response = client.get('/api/articles/latest', headers={'Accept-Encoding': 'gzip'})
+            assert response.headers.get('Content-Encoding') == 'gzip'
+        assert compress.call_count == 1
+    
+    def test_get_latest_articles_serves_database_rows(self, db_client: FlaskClient, db_session: Session) -> None:
+        """Test the endpoint end to end against the SQLite test database."""
+        db_session.add(Article(
+            title='Stored Article',
+            summary='Stored summary',
+            published_at=datetime(2024, 5, 29, 12, 0, 0),
+            source_url='https://example.com/stored'
+        ))
+        db_session.commit()
+        
+        response = db_client.get('/api/articles/latest')
+        
+        assert response.status_code == 200
+        articles = response.get_json()['data']['articles']
+        assert [article['title'] for article in articles] == ['Stored Article']
+        assert articles[0]['published_at'] == '2024-05-29T12:00:00Z'
\ No newline at end of file
@@ -6,149 +6,218 @@ focusing on the get_latest_articles() method that retrieves the latest
 """
 
 import pytest
-from datetime import datetime, timedelta
+import statistics
+import time
+from datetime import datetime
 from unittest.mock import Mock, patch
-from typing import List, Dict, Any
+from typing import Any, Dict, Optional, Sequence
 
+from sqlalchemy.exc import OperationalError
+from sqlalchemy.orm import Session
+
+from app.models.article import Article
 from app.services.article_service import ArticleService
-from app.exceptions import DatabaseError, ApplicationError
+from app.exceptions import DatabaseError
+
+
+# Shared, read-only sample rows; fixed timestamps keep tests deterministic
+_SAMPLE_ARTICLES = (
+    {
+        'id': 1,
+        'title': 'Latest AI Breakthrough in Language Models',
+        'summary': 'A' * 150,  # 150 characters to test truncation
+        'published_at': datetime(2024, 1, 1, 12, 0, 0),
+        'source_url': 'https://example.com/article1'
+    },
+    {
+        'id': 2,
+        'title': 'GPT-4 Update Announcement',
+        'summary': 'B' * 80,  # 80 characters, should not be truncated
+        'published_at': datetime(2024, 1, 1, 11, 0, 0),
+        'source_url': 'https://example.com/article2'
+    },
+    {
+        'id': 3,
+        'title': 'Claude AI New Features',
+        'summary': 'C' * 200,  # 200 characters to test truncation
+        'published_at': datetime(2024, 1, 1, 10, 0, 0),
+        'source_url': 'https://example.com/article3'
+    }
+)
+
+# URL schemes accepted for article source links
+_HTTP_PREFIXES = ('http://', 'https://')
+
+# Exact key set of an article returned by the service
+_REQUIRED_ARTICLE_KEYS = frozenset({'id', 'title', 'summary_truncated', 'published_at', 'source_url'})
+
+
+def _stub_session(rows: Sequence[Dict[str, Any]] = (), error: Optional[Exception] = None) -> Mock:
+    """Build a stand-in Session whose latest-articles query yields the given rows.
+    
+    Args:
+        rows: Row mappings returned by execute().mappings().all()
+        error: Exception raised by execute() instead, if given
+        
+    Returns:
+        Mock: Stub session for ArticleService
+    """
+    session = Mock()
+    session.execute.return_value.mappings.return_value.all.return_value = list(rows)
+    session.execute.side_effect = error
+    return session
+
+
+@pytest.fixture(scope="session")
+def article_service() -> ArticleService:
+    """Provide one service over a stub session returning the sample rows.
+    
+    ArticleService holds no per-call state besides its session, so a
+    single instance is enough; its results cache is reset per test.
+    """
+    return ArticleService(_stub_session(_SAMPLE_ARTICLES))
+
+
+@pytest.fixture(scope="session")
+def empty_article_service() -> ArticleService:
+    """Provide a service over a stub session with no articles."""
+    return ArticleService(_stub_session())
+
+
+@pytest.fixture(scope="session")
+def failing_article_service() -> ArticleService:
+    """Provide a service whose stub session fails every query."""
+    return ArticleService(_stub_session(error=OperationalError('SELECT', {}, Exception('connection refused'))))
 
 
 class TestArticleService:
     """Test cases for ArticleService class."""
     
     def setup_method(self) -> None:
-        """Set up test fixtures before each test method."""
-        from unittest.mock import Mock
-        self.mock_db_session = Mock()
-        self.service = ArticleService(self.mock_db_session)
-        self.sample_articles = [
-            {
-                'id': 1,
-                'title': 'Latest AI Breakthrough in Language Models',
-                'summary': 'A' * 150,  # 150 characters to test truncation
-                'published_at': datetime.now(),
-                'source_url': 'https://example.com/article1'
-            },
-            {
-                'id': 2,
-                'title': 'GPT-4 Update Announcement',
-                'summary': 'B' * 80,  # 80 characters, should not be truncated
-                'published_at': datetime.now() - timedelta(hours=1),
-                'source_url': 'https://example.com/article2'
-            },
-            {
-                'id': 3,
-                'title': 'Claude AI New Features',
-                'summary': 'C' * 200,  # 200 characters to test truncation
-                'published_at': datetime.now() - timedelta(hours=2),
-                'source_url': 'https://example.com/article3'
-            }
-        ]
-    
-    def test_get_latest_articles_returns_correct_format(self) -> None:
+        """Start each test without cached results from earlier tests."""
+        ArticleService.invalidate_cache()
+    
+    def teardown_method(self) -> None:
+        """Drop cached results so they cannot leak into other tests."""
+        ArticleService.invalidate_cache()
+    
+    def test_get_latest_articles_returns_correct_format(self, article_service: ArticleService) -> None:
         """Test that get_latest_articles returns articles in the correct format.
         
         This test verifies that the method returns a list of dictionaries
-        with the required keys: title, summary_truncated, published_at, source_url.
+        with the required keys: id, title, summary_truncated, published_at, source_url.
         """
         # This test should fail initially (RED phase)
-        result = self.service.get_latest_articles()
+        result = article_service.get_latest_articles()
         
         assert isinstance(result, list)
-        assert len(result) <= 5
+        assert len(result) <= 5, f"Expected at most 5 articles, got {len(result)}"
         
         if result:  # If articles exist
             article = result[0]
-            required_keys = {'title', 'summary_truncated', 'published_at', 'source_url'}
-            assert set(article.keys()) == required_keys
+            assert article.keys() == _REQUIRED_ARTICLE_KEYS, f"Unexpected article keys: {sorted(article.keys())}"
     
-    def test_get_latest_articles_limits_to_five_articles(self) -> None:
+    def test_get_latest_articles_limits_to_five_articles(self, article_service: ArticleService) -> None:
         """Test that get_latest_articles returns maximum 5 articles.
         
         This test ensures that even if more than 5 articles exist in the database,
         the method returns only the 5 most recent ones.
         """
-        result = self.service.get_latest_articles()
+        result = article_service.get_latest_articles()
         
         assert isinstance(result, list)
-        assert len(result) <= 5
+        assert len(result) <= 5, f"Expected at most 5 articles, got {len(result)}"
     
-    def test_get_latest_articles_sorts_by_published_date_desc(self) -> None:
+    def test_get_latest_articles_sorts_by_published_date_desc(self, article_service: ArticleService) -> None:
         """Test that articles are sorted by published_at in descending order.
         
         This test verifies that the most recently published articles appear first
         in the returned list.
         """
-        result = self.service.get_latest_articles()
+        result = article_service.get_latest_articles()
         
-        if len(result) > 1:
-            for i in range(len(result) - 1):
-                current_date = result[i]['published_at']
-                next_date = result[i + 1]['published_at']
-                assert current_date >= next_date
+        dates = [article['published_at'] for article in result]
+        assert dates == sorted(dates, reverse=True), f"Articles not sorted newest first: {dates}"
     
-    def test_get_latest_articles_truncates_summary_to_100_chars(self) -> None:
+    def test_get_latest_articles_truncates_summary_to_100_chars(self, article_service: ArticleService) -> None:
         """Test that summary is truncated to 100 characters with ellipsis.
         
         This test ensures that long summaries are properly truncated to 100
         characters and end with '...' to indicate truncation.
         """
-        result = self.service.get_latest_articles()
+        result = article_service.get_latest_articles()
         
         for article in result:
             summary = article['summary_truncated']
-            if len(summary) > 100:
-                assert summary.endswith('...')
-                assert len(summary) == 103  # 100 chars + '...'
-            else:
-                assert not summary.endswith('...')
+            length = len(summary)
+            is_truncated = length > 100
+            
+            # Exactly the truncated summaries carry the ellipsis
+            assert is_truncated == (summary[-3:] == '...'), f"Ellipsis mismatch for {length}-char summary: {summary!r}"
+            if is_truncated:
+                assert length == 103, f"Truncated summary should be 100 chars + '...', got {length}"
     
-    def test_get_latest_articles_handles_empty_database(self) -> None:
+    def test_get_latest_articles_handles_empty_database(self, empty_article_service: ArticleService) -> None:
         """Test behavior when no articles exist in the database.
         
         This test verifies that the method gracefully handles an empty database
         and returns an empty list without raising exceptions.
         """
-        result = self.service.get_latest_articles()
+        result = empty_article_service.get_latest_articles()
         
         # Should return empty list, not raise exception
-        assert isinstance(result, list)
-        assert len(result) >= 0  # Could be empty
+        assert result == [], f"Expected no articles, got {result}"
     
-    def test_get_latest_articles_handles_database_error(self) -> None:
+    def test_get_latest_articles_handles_database_error(self, failing_article_service: ArticleService) -> None:
         """Test error handling when database connection fails.
         
         This test verifies that DatabaseError is properly raised when
         database operations fail.
         """
         with pytest.raises(DatabaseError):
-            # This should eventually raise DatabaseError when connection fails
-            # For now, this test will fail as the method doesn't exist
-            self.service.get_latest_articles()
+            failing_article_service.get_latest_articles()
     
-    def test_get_latest_articles_performance_requirement(self) -> None:
+    def test_get_latest_articles_performance_requirement(self, db_session: Session) -> None:
         """Test that get_latest_articles completes within 50ms.
         
         This test ensures the method meets performance requirements
-        for fast API responses.
+        for fast API responses. It runs the real query and formatting
+        against the SQLite test database, so the timing reflects the
+        code path rather than a stub failing fast.
         """
-        import time
+        db_session.add_all([
+            Article(
+                title=f'Article {index}',
+                summary=_SAMPLE_ARTICLES[index % len(_SAMPLE_ARTICLES)]['summary'],
+                published_at=datetime(2024, 1, 1, index),
+                source_url=f'https://example.com/perf/{index}'
+            )
+            for index in range(20)
+        ])
+        db_session.flush()
+        service = ArticleService(db_session)
+        
+        # Warm up once, then time uncached calls and compare the median
+        service.get_latest_articles()
         
-        start_time = time.time()
-        self.service.get_latest_articles()
-        end_time = time.time()
+        samples_ns = []
+        for _ in range(20):
+            ArticleService.invalidate_cache()
+            start_ns = time.perf_counter_ns()
+            result = service.get_latest_articles()
+            samples_ns.append(time.perf_counter_ns() - start_ns)
         
-        execution_time = (end_time - start_time) * 1000  # Convert to milliseconds
-        assert execution_time < 50, f"Method took {execution_time:.2f}ms, exceeds 50ms limit"
+        assert len(result) == 5, f"Expected 5 articles, got {len(result)}"
+        execution_time = statistics.median(samples_ns) / 1_000_000  # Convert to milliseconds
+        assert execution_time < 50, f"Method took {execution_time:.2f}ms (median), exceeds 50ms limit"
     
-    def test_get_latest_articles_returns_required_fields(self) -> None:
+    def test_get_latest_articles_returns_required_fields(self, article_service: ArticleService) -> None:
         """Test that all required fields are present and correctly formatted.
         
         This test verifies that each article contains all required fields
         with proper data types and formats.
         """
-        result = self.service.get_latest_articles()
+        result = article_service.get_latest_articles()
         
         for article in result:
             # Check required fields exist
@@ -158,17 +227,17 @@ class TestArticleService:
             assert 'source_url' in article
             
             # Check data types
-            assert isinstance(article['title'], str)
-            assert isinstance(article['summary_truncated'], str)
-            assert isinstance(article['published_at'], datetime)
-            assert isinstance(article['source_url'], str)
+            assert type(article['title']) is str
+            assert type(article['summary_truncated']) is str
+            assert type(article['published_at']) is datetime
+            assert type(article['source_url']) is str
             
             # Check field constraints
-            assert len(article['title']) > 0
-            assert len(article['summary_truncated']) >= 0
-            assert article['source_url'].startswith(('http://', 'https://'))
+            assert len(article['title']) > 0, "Article title should not be empty"
+            assert len(article['summary_truncated']) >= 0, f"Invalid summary length: {len(article['summary_truncated'])}"
+            assert article['source_url'].startswith(_HTTP_PREFIXES)
     
-    def test_get_latest_articles_handles_malformed_data(self) -> None:
+    def test_get_latest_articles_handles_malformed_data(self, article_service: ArticleService) -> None:
         """Test error handling for malformed data in database.
         
         This test verifies that the method properly handles and validates
@@ -176,7 +245,7 @@ class TestArticleService:
         """
         # This test should verify data validation
         # Will initially fail as validation logic doesn't exist yet
-        result = self.service.get_latest_articles()
+        result = article_service.get_latest_articles()
         
         # All articles should have valid data
         for article in result:
@@ -185,14 +254,14 @@ class TestArticleService:
             assert article['published_at'] is not None
             assert article['source_url'] is not None
 
-    def test_get_latest_articles_returns_article_id_in_each_article(self) -> None:
+    def test_get_latest_articles_returns_article_id_in_each_article(self, article_service: ArticleService) -> None:
         """Test that get_latest_articles returns article ID in each article.
         
         This test verifies that each article dictionary contains an 'id' key
         with an integer value, which is essential for frontend functionality
         like unique React keys and article detail navigation.
         """
-        result = self.service.get_latest_articles()
+        result = article_service.get_latest_articles()
         
         # Verify we have articles to test
         assert isinstance(result, list)
@@ -209,8 +278,6 @@ class TestArticleService:
         This test verifies that ArticleService properly uses injected database sessions
         rather than creating its own engines, preventing resource leaks.
         """
-        from unittest.mock import Mock
-        
         # Create mock sessions to simulate different request contexts
         mock_session_1 = Mock()
         mock_session_2 = Mock()
@@ -230,4 +297,45 @@ class TestArticleService:
         # This demonstrates proper session management:
         # - No database engines created per service instance
         # - Sessions managed at request level via dependency injection
-        # - Service instances are lightweight and testable
\ No newline at end of file
+        # - Service instances are lightweight and testable
+    
+    def test_get_latest_articles_reuses_cached_result_within_ttl(self, article_service: ArticleService) -> None:
+        """Test that repeated calls within the TTL do not query the database again."""
+        with patch.object(ArticleService, '_fetch_articles_from_database',
+                          return_value=_SAMPLE_ARTICLES) as mock_fetch:
+            first = article_service.get_latest_articles()
+            second = ArticleService(Mock()).get_latest_articles()
+        
+        assert mock_fetch.call_count == 1, f"Expected 1 database fetch, got {mock_fetch.call_count}"
+        assert second is first
+    
+    def test_invalidate_cache_forces_refetch(self, article_service: ArticleService) -> None:
+        """Test that invalidate_cache() makes the next call read from the database."""
+        with patch.object(ArticleService, '_fetch_articles_from_database',
+                          return_value=_SAMPLE_ARTICLES) as mock_fetch:
+            article_service.get_latest_articles()
+            ArticleService.invalidate_cache()
+            article_service.get_latest_articles()
+        
+        assert mock_fetch.call_count == 2, f"Expected 2 database fetches, got {mock_fetch.call_count}"
+    
+    def test_get_latest_articles_reads_newest_rows_from_database(self, db_session: Session) -> None:
+        """Test the real query against SQLite: newest five rows, truncated summaries."""
+        db_session.add_all([
+            Article(
+                title=f'Article {day}',
+                summary='S' * (90 + day * 5),
+                published_at=datetime(2024, 1, day),
+                source_url=f'https://example.com/{day}'
+            )
+            for day in range(1, 8)
+        ])
+        db_session.commit()
+        
+        result = ArticleService(db_session).get_latest_articles()
+        
+        titles = [article['title'] for article in result]
+        assert titles == [f'Article {day}' for day in range(7, 2, -1)], f"Unexpected titles: {titles}"
+        lengths = [len(article['summary_truncated']) for article in result]
+        assert lengths == [103] * 5, f"Unexpected summary lengths: {lengths}"
+        assert all(isinstance(article['published_at'], datetime) for article in result)
\ No newline at end of file
@@ -5,9 +5,33 @@ database objects to API response formats.
 """
 
 import pytest
-from unittest.mock import Mock
+from typing import Any, Callable, Dict
+
 from app.services.formatters import ArticleFormatter
 
+ArticleFactory = Callable[..., Dict[str, Any]]
+
+
+@pytest.fixture(scope="module")
+def make_article() -> ArticleFactory:
+    """Provide a factory for valid article rows with per-test overrides.
+    
+    The factory is stateless and returns a new dict on every call, so
+    one instance is shared by the whole module.
+    """
+    def _make(**overrides: Any) -> Dict[str, Any]:
+        article = {
+            'id': 1,
+            'title': "Valid Title",
+            'summary': "Valid summary",
+            'published_at': "2024-01-15T10:30:00Z",
+            'source_url': "https://example.com"
+        }
+        article.update(overrides)
+        return article
+    
+    return _make
+
 
 class TestArticleFormatter:
     """Test cases for ArticleFormatter class."""
@@ -45,63 +69,24 @@ class TestArticleFormatter:
         
         assert result == ""  # Should return empty string for None
 
-    def test_format_article_for_api_handles_none_fields(self) -> None:
-        """RED phase test: format_article_for_api should handle None fields."""
-        # Test for None title
-        article_none_title = Mock()
-        article_none_title.id = 1
-        article_none_title.title = None
-        article_none_title.summary = "Valid summary"
-        article_none_title.published_at = "2024-01-15T10:30:00Z"
-        article_none_title.source_url = "https://example.com"
-        
-        with pytest.raises(ValueError, match="Article title cannot be None"):
-            ArticleFormatter.format_article_for_api(article_none_title)
-
-    def test_format_article_for_api_handles_none_id(self) -> None:
-        """RED phase test: format_article_for_api should handle None ID."""
-        article_none_id = Mock()
-        article_none_id.id = None
-        article_none_id.title = "Valid Title"
-        article_none_id.summary = "Valid summary"
-        article_none_id.published_at = "2024-01-15T10:30:00Z"
-        article_none_id.source_url = "https://example.com"
-        
-        with pytest.raises(ValueError, match="Article ID cannot be None"):
-            ArticleFormatter.format_article_for_api(article_none_id)
-
-    def test_format_article_for_api_handles_none_published_at(self) -> None:
-        """RED phase test: format_article_for_api should handle None published_at."""
-        article_none_published = Mock()
-        article_none_published.id = 1
-        article_none_published.title = "Valid Title"
-        article_none_published.summary = "Valid summary"
-        article_none_published.published_at = None
-        article_none_published.source_url = "https://example.com"
+    @pytest.mark.parametrize('field, expected_message', [
+        ('title', "Article title cannot be None"),
+        ('id', "Article ID cannot be None"),
+        ('published_at', "Article published_at cannot be None"),
+        ('source_url', "Article source_url cannot be None"),
+    ])
+    def test_format_article_for_api_rejects_none_field(
+        self, make_article: ArticleFactory, field: str, expected_message: str
+    ) -> None:
+        """RED phase test: format_article_for_api should reject None required fields."""
+        article = make_article(**{field: None})
         
-        with pytest.raises(ValueError, match="Article published_at cannot be None"):
-            ArticleFormatter.format_article_for_api(article_none_published)
-
-    def test_format_article_for_api_handles_none_source_url(self) -> None:
-        """RED phase test: format_article_for_api should handle None source_url."""
-        article_none_url = Mock()
-        article_none_url.id = 1
-        article_none_url.title = "Valid Title"
-        article_none_url.summary = "Valid summary"
-        article_none_url.published_at = "2024-01-15T10:30:00Z"
-        article_none_url.source_url = None
-        
-        with pytest.raises(ValueError, match="Article source_url cannot be None"):
-            ArticleFormatter.format_article_for_api(article_none_url)
+        with pytest.raises(ValueError, match=expected_message):
+            ArticleFormatter.format_article_for_api(article)
 
-    def test_format_article_for_api_handles_none_summary(self) -> None:
+    def test_format_article_for_api_handles_none_summary(self, make_article: ArticleFactory) -> None:
         """RED phase test: format_article_for_api should handle None summary gracefully."""
-        article_none_summary = Mock()
-        article_none_summary.id = 1
-        article_none_summary.title = "Valid Title"
-        article_none_summary.summary = None
-        article_none_summary.published_at = "2024-01-15T10:30:00Z"
-        article_none_summary.source_url = "https://example.com"
+        article_none_summary = make_article(summary=None)
         
         result = ArticleFormatter.format_article_for_api(article_none_summary)
         
@@ -110,14 +95,13 @@ class TestArticleFormatter:
         assert result['id'] == 1
         assert result['title'] == "Valid Title"
 
-    def test_format_article_for_api_with_valid_data(self) -> None:
+    def test_format_article_for_api_with_valid_data(self, make_article: ArticleFactory) -> None:
         """Test format_article_for_api with valid complete data."""
-        article = Mock()
-        article.id = 1
-        article.title = "Test Article Title"
-        article.summary = "This is a test article summary that is quite long and should be truncated."
-        article.published_at = "2024-01-15T10:30:00Z"
-        article.source_url = "https://example.com/article"
+        article = make_article(
+            title="Test Article Title",
+            summary="This is a test article summary that is quite long and should be truncated.",
+            source_url="https://example.com/article"
+        )
         
         result = ArticleFormatter.format_article_for_api(article)
         
@@ -125,4 +109,27 @@ class TestArticleFormatter:
         assert result['title'] == "Test Article Title"
         assert 'summary_truncated' in result
         assert result['published_at'] == "2024-01-15T10:30:00Z"
-        assert result['source_url'] == "https://example.com/article"
\ No newline at end of file
+        assert result['source_url'] == "https://example.com/article"
+
+    def test_format_articles_list_matches_format_article_for_api(self, make_article: ArticleFactory) -> None:
+        """Test that format_articles_list formats each row like format_article_for_api."""
+        articles = [
+            make_article(
+                id=index,
+                title=f"Title {index}",
+                summary=summary,
+                source_url=f"https://example.com/{index}"
+            )
+            for index, summary in enumerate(["A" * 150, "B" * 100, None], start=1)
+        ]
+        
+        result = ArticleFormatter.format_articles_list(articles)
+        
+        assert result == [ArticleFormatter.format_article_for_api(article) for article in articles]
+
+    def test_format_articles_list_rejects_none_fields(self, make_article: ArticleFactory) -> None:
+        """Test that format_articles_list raises for rows missing required values."""
+        articles = [make_article(title=None)]
+        
+        with pytest.raises(ValueError, match="Article title cannot be None"):
+            ArticleFormatter.format_articles_list(articles)
\ No newline at end of file
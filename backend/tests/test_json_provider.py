@@ -0,0 +1,66 @@
+"""Test suite for the orjson JSON provider.
+
+This module contains tests for the Flask JSON provider used to
+serialize API responses.
+"""
+
+from datetime import datetime, timezone
+
+import pytest
+from flask import Flask
+
+from app.utils.json_provider import OrjsonProvider
+
+
+class TestOrjsonProvider:
+    """Test cases for OrjsonProvider class."""
+    
+    def setup_method(self) -> None:
+        """Set up test fixtures before each test method."""
+        self.app = Flask(__name__)
+        self.provider = OrjsonProvider(self.app)
+    
+    def test_dumps_naive_datetime_as_utc_iso8601(self) -> None:
+        """Test that naive datetimes are serialized with a 'Z' suffix."""
+        result = self.provider.dumps({'published_at': datetime(2024, 5, 29, 12, 0, 0)})
+        
+        assert result == '{"published_at":"2024-05-29T12:00:00Z"}'
+    
+    def test_dumps_utc_aware_datetime_as_utc_iso8601(self) -> None:
+        """Test that UTC-aware datetimes are serialized with a 'Z' suffix."""
+        utc_dt = datetime(2024, 5, 29, 15, 30, 0, tzinfo=timezone.utc)
+        result = self.provider.dumps({'published_at': utc_dt})
+        
+        assert result == '{"published_at":"2024-05-29T15:30:00Z"}'
+    
+    def test_loads_round_trip(self) -> None:
+        """Test that loads decodes what dumps produced."""
+        data = {'articles': [{'id': 1, 'title': 'タイトル'}], 'count': 1}
+        
+        assert self.provider.loads(self.provider.dumps(data)) == data
+        assert self.provider.loads(self.provider.dumps(data).encode()) == data
+    
+    def test_response_is_application_json(self) -> None:
+        """Test that response() builds an application/json response."""
+        with self.app.app_context():
+            response = self.provider.response({'status': 'healthy'})
+        
+        assert response.mimetype == 'application/json'
+        assert response.get_data() == b'{"status":"healthy"}'
+    
+    @pytest.mark.parametrize('args, kwargs, expected', [
+        ((), {}, b'null'),
+        ((1, 2), {}, b'[1,2]'),
+        ((), {'count': 1}, b'{"count":1}'),
+    ], ids=['no_arguments', 'several_args', 'kwargs'])
+    def test_response_follows_jsonify_arguments(self, args: tuple, kwargs: dict, expected: bytes) -> None:
+        """Test that response() maps its arguments like jsonify()."""
+        with self.app.app_context():
+            response = self.provider.response(*args, **kwargs)
+        
+        assert response.get_data() == expected
+    
+    def test_response_rejects_args_and_kwargs(self) -> None:
+        """Test that mixing positional and keyword arguments is an error."""
+        with self.app.app_context(), pytest.raises(TypeError):
+            self.provider.response(1, count=1)
\ No newline at end of file
@@ -27,8 +27,16 @@ Base.metadata.create_all(engine)
 print('Test database schema created!')
 "
     
+    # Shard test files across CPU cores when pytest-xdist is installed;
+    # --dist=loadfile keeps each module (and its module/session fixtures)
+    # on a single worker
+    xdist_args=""
+    if poetry run python -c "import xdist" &> /dev/null; then
+        xdist_args="-n auto --dist=loadfile"
+    fi
+    
     # Run pytest with coverage
-    poetry run pytest tests/ -v --cov=app --cov-report=term-missing --cov-report=html
+    poetry run pytest tests/ -v $xdist_args --cov=app --cov-report=term-missing --cov-report=html
     
     cd ..
     echo "✅ Backend tests completed!"